@@ -9,6 +9,145 @@ from comfy_api.latest import io
 import node_helpers
 
 
+# Wan21's process_out is a per-channel affine, so converting an all-zero latent
+# always yields the same [1, 16, 1, 1, 1] constant. Compute it once and
+# broadcast it over padding slots instead of converting zeros on every call.
+_WAN21_ZERO_LATENT = comfy.latent_formats.Wan21().process_out(
+    torch.zeros(1, 16, 1, 1, 1)
+)
+
+# _WAN21_ZERO_LATENT converted per (device, dtype), so repeated runs on the
+# same device skip the host-to-device transfer entirely.
+_ZERO_CACHE = {}
+
+
+def _wan21_zero_latent(device, dtype):
+    """Return _WAN21_ZERO_LATENT on `device` as `dtype`, cached per pair."""
+    key = (device, dtype)
+    zero_const = _ZERO_CACHE.get(key)
+    if zero_const is None:
+        zero_const = _WAN21_ZERO_LATENT.to(device=device, dtype=dtype)
+        _ZERO_CACHE[key] = zero_const
+    return zero_const
+
+
+@torch.jit.script
+def _assemble_cond(
+    dst: torch.Tensor,
+    anchor: torch.Tensor,
+    motion: torch.Tensor,
+    zero_const: torch.Tensor,
+    t_a: int,
+    t_m: int,
+    t_pad_end: int,
+) -> torch.Tensor:
+    """
+    Fill dst [B, C, T, H, W] along T as [anchor | motion | zero_const].
+
+    Scripted so the three region copies run without per-op Python dispatch.
+    `motion` may have T=0; `zero_const` is broadcast over the padding slots
+    up to `t_pad_end`. Slots from `t_pad_end` on are left for the caller.
+
+    Empty regions are skipped, so plain I2V (no motion tail) costs just the
+    anchor and padding copies. Skipping empty padding also keeps latents
+    whose channel count differs from the 16-channel zero constant working
+    as long as anchor + motion fill the clip.
+    """
+    dst[:, :, :t_a].copy_(anchor)
+    if t_m > 0:
+        dst[:, :, t_a : t_a + t_m].copy_(motion)
+    if t_pad_end > t_a + t_m:
+        dst[:, :, t_a + t_m : t_pad_end].copy_(zero_const)
+    return dst
+
+
+def _build_cond(
+    anchor_latent,
+    prev_tail,
+    end_latent,
+    T_anchor,
+    T_motion,
+    T_end,
+    total_latents,
+    zero_const,
+    B,
+    C,
+    H,
+    W,
+    dtype,
+    device,
+):
+    """
+    Build the concat latent and concat mask for WanImageToVideoSVIProFLF.
+
+    Takes only tensors and ints so it stays free of ComfyUI dicts:
+    - anchor_latent: anchor slots [B, C, T_a, H, W], already capped to fit.
+    - prev_tail: motion tail [B, C, T_m, H, W] (T_m may be 0), already capped.
+    - end_latent: end block [B, C, T_end, H, W] or None.
+    - T_anchor, T_motion, T_end: temporal lengths of the above, as already
+      unpacked by the caller (T_end = 0 when end_latent is None).
+
+    Returns (image_cond_latent, mask, end_t_fix), where mask is a uint8
+    [1, 1, total_latents, 1, 1] tensor (0 = locked slot, 1 = free slot).
+    """
+    # FLF2V-style: fix as many frames as the end block provides,
+    # but not more than total_latents.
+    end_t_fix = min(T_end, total_latents)
+
+    # -------------------------------------------------------------------------
+    # 1) Fill the conditioning latent in place:
+    #    [anchor | motion | Wan-format zeros] up to total_latents.
+    #    Allocating once and copying each region avoids the intermediate
+    #    tensors (and doubled peak memory) of torch.cat. The anchor and
+    #    motion slots are capped by the caller, so the result has exactly
+    #    total_latents slots by construction.
+    #
+    #    Padding slots covered by the end block are skipped, since step 2
+    #    overwrites them. Free (mask=1) padding must still hold Wan zeros:
+    #    the model reads concat_latent_image in every slot, not only locked
+    #    ones.
+    # -------------------------------------------------------------------------
+    image_cond_latent = _assemble_cond(
+        torch.empty((B, C, total_latents, H, W), dtype=dtype, device=device),
+        anchor_latent,
+        prev_tail,
+        zero_const,
+        T_anchor,
+        T_motion,
+        total_latents - end_t_fix,
+    )
+
+    # -------------------------------------------------------------------------
+    # 2) End behavior like WanFirstLastFrameToVideoLatent (FLF-style):
+    #    hard-lock the last frames to end_latent, if provided.
+    # -------------------------------------------------------------------------
+    if end_t_fix > 0:
+        # Overwrite the last `end_t_fix` temporal slots of
+        # image_cond_latent with the last slots of end_latent.
+        image_cond_latent[:, :, -end_t_fix:] = end_latent[:, :, -end_t_fix:]
+
+    # -------------------------------------------------------------------------
+    # 3) Mask:
+    #    - First temporal slot (anchor) is fixed: mask=0 at t=0.
+    #    - Last end_t_fix slots are fixed if end_latent is provided.
+    #
+    # Wan / SVI Pro use concat_mask==0 to mark slots that should stay
+    # equal to concat_latent_image during sampling.
+    #
+    # The mask only varies along T and only holds 0/1, so it is built as a
+    # uint8 [1, 1, T, 1, 1] tensor; the caller casts it to the latent dtype
+    # and broadcasts it to [1, 1, T, H, W] when injecting it.
+    # -------------------------------------------------------------------------
+    # Locked slots: the anchor slot plus the last end_t_fix slots (never
+    # overlapping slot 0). Start from zeros and only write the free band
+    # between them: one allocation and one write whatever the lock ratio.
+    end_start = max(total_latents - end_t_fix, 1)
+    mask = torch.zeros((1, 1, total_latents, 1, 1), device=device, dtype=torch.uint8)
+    mask[:, :, 1:end_start] = 1
+
+    return image_cond_latent, mask, end_t_fix
+
+
 class WanImageToVideoSVIProFLF(io.ComfyNode):
     """
     WanImageToVideoSVIProFLF
@@ -112,7 +251,7 @@ class WanImageToVideoSVIProFLF(io.ComfyNode):
         """
 
         # Anchor latent for this segment: [B, C, T_anchor, H, W]
-        anchor_latent = anchor_samples["samples"].clone()
+        anchor_latent = anchor_samples["samples"]
         B, C, T_anchor, H, W = anchor_latent.shape
 
         # Compute number of temporal latent slots given Wan's stride=4.
@@ -125,87 +264,83 @@ class WanImageToVideoSVIProFLF(io.ComfyNode):
         # 1) Base temporal block:
         #    anchor + optional motion tail from prev_samples (SVI Pro logic).
         # ---------------------------------------------------------------------
+        # Anchor slots that fit into the clip.
+        T_anchor_eff = min(T_anchor, total_latents)
+
         if prev_samples is None or motion_latent_count == 0:
             # No previous segment or motion continuity disabled:
-            # start purely from the anchor latent block.
-            base_latent = anchor_latent
+            # start purely from the anchor latent block (empty motion tail).
+            T_motion = 0
+            motion_latent = anchor_latent[:, :, :0]
         else:
             # Previous segment latents: [B, C, T_prev, H, W]
-            prev_latent = prev_samples["samples"].clone()
-            T_prev = prev_latent.shape[2]
+            prev_latent = prev_samples["samples"]
+            _, _, T_prev, _, _ = prev_latent.shape
 
             # We can only take as many time slots as prev_latent actually has.
             motion_count = min(motion_latent_count, T_prev)
 
-            if motion_count > 0:
-                # Take the last `motion_count` temporal slots as motion tail:
-                # shape [B, C, T_m, H, W].
-                motion_latent = prev_latent[:, :, -motion_count:]
-                # Concatenate anchor and motion along the temporal axis.
-                base_latent = torch.cat([anchor_latent, motion_latent], dim=2)
-            else:
-                # motion_latent_count requested 0 or prev had T_prev=0 (edge case)
-                base_latent = anchor_latent
+            # Of those, only as many as still fit after the anchor block.
+            T_motion = min(motion_count, total_latents - T_anchor_eff)
 
-        T_base = base_latent.shape[2]
-        padding_size = max(total_latents - T_base, 0)
+            # Take the last `motion_count` temporal slots as motion tail
+            # (truncated to what fits): shape [B, C, T_motion, H, W].
+            motion_start = T_prev - motion_count
+            motion_latent = prev_latent[:, :, motion_start : motion_start + T_motion]
 
         # ---------------------------------------------------------------------
-        # 2) Pad with Wan-format zeros to reach total_latents.
-        #    This ensures the conditioning latent has the exact temporal
-        #    length expected by the Wan sampler.
-        # ---------------------------------------------------------------------
-        if padding_size > 0:
-            # Create zero latents and convert them to Wan's internal format.
-            padding = torch.zeros(B, C, padding_size, H, W, dtype=dtype, device=device)
-            padding = comfy.latent_formats.Wan21().process_out(padding)
-            # Append padding after the base sequence.
-            image_cond_latent = torch.cat([base_latent, padding], dim=2)
-        else:
-            # If base_latent is longer than needed, truncate it.
-            image_cond_latent = base_latent[:, :, :total_latents]
-
-        # Safety clamp in case of any mismatch.
-        if image_cond_latent.shape[2] != total_latents:
-            image_cond_latent = image_cond_latent[:, :, :total_latents]
-
+        # 2) End block like WanFirstLastFrameToVideoLatent (FLF-style),
+        #    if provided and compatible with the segment.
         # ---------------------------------------------------------------------
-        # 3) End behavior like WanFirstLastFrameToVideoLatent (FLF-style):
-        #    hard-lock the last frames to end_samples, if provided.
-        # ---------------------------------------------------------------------
-        end_t_fix = 0
+        end_latent = None
+        T_end = 0
         if end_samples is not None:
             # [B_end, C, T_end, H, W] or [1, C, T_end, H, W]
-            end_latent = end_samples["samples"].clone()
+            end_latent = end_samples["samples"]
+            B_end, C_end, T_end, H_end, W_end = end_latent.shape
 
             # If end_latent has batch size 1 but our segment batch is larger,
-            # repeat it across the batch dimension.
-            if end_latent.shape[0] == 1 and B > 1:
-                end_latent = end_latent.repeat(B, 1, 1, 1, 1)
+            # broadcast it across the batch dimension (read-only view).
+            if B_end == 1 and B > 1:
+                end_latent = end_latent.expand(B, -1, -1, -1, -1)
 
             # Check that channels and spatial dimensions match.
-            if (
-                end_latent.shape[1] == C
-                and end_latent.shape[3] == H
-                and end_latent.shape[4] == W
-            ):
-                T_end = end_latent.shape[2]
-
-                # FLF2V-style: fix as many frames as the end block provides,
-                # but not more than total_latents.
-                end_t_fix = min(T_end, total_latents)
-
-                if end_t_fix > 0:
-                    # Overwrite the last `end_t_fix` temporal slots of
-                    # image_cond_latent with the last slots of end_latent.
-                    image_cond_latent[:, :, -end_t_fix:] = end_latent[:, :, -end_t_fix:]
-            else:
+            if not (C_end == C and H_end == H and W_end == W):
                 # Shape mismatch: skip end locking for safety.
-                end_t_fix = 0
+                end_latent = None
+                T_end = 0
+
+        # ---------------------------------------------------------------------
+        # 3) Conditioning latent and mask (tensor-only work).
+        # ---------------------------------------------------------------------
+        # Wan's zero latent is a per-channel constant; it is broadcast over
+        # the padding slots instead of converting a full zero tensor.
+        zero_const = _wan21_zero_latent(device, dtype)
+
+        image_cond_latent, mask, _ = _build_cond(
+            anchor_latent[:, :, :T_anchor_eff],
+            motion_latent,
+            end_latent,
+            T_anchor_eff,
+            T_motion,
+            T_end,
+            total_latents,
+            zero_const,
+            B,
+            C,
+            H,
+            W,
+            dtype,
+            device,
+        )
 
         # ---------------------------------------------------------------------
         # 4) Empty latent to be filled by the Wan sampler.
         #    Shape: [B, 16, total_latents, H, W] for Wan video UNet.
+        #
+        #    This must stay zero-filled rather than torch.empty: samplers blend
+        #    it with noise ((1 - sigma) * latent), use it as-is when noise is
+        #    disabled, and ComfyUI detects "empty" latents by counting nonzeros.
         # ---------------------------------------------------------------------
         empty_latent = torch.zeros(
             [B, 16, total_latents, H, W],
@@ -213,41 +348,18 @@ class WanImageToVideoSVIProFLF(io.ComfyNode):
         )
 
         # ---------------------------------------------------------------------
-        # 5) Mask:
-        #    - First temporal slot (anchor) is fixed: mask=0 at t=0.
-        #    - Last end_t_fix slots are fixed if end_samples is provided.
-        #
-        # Wan / SVI Pro use concat_mask==0 to mark slots that should stay
-        # equal to concat_latent_image during sampling.
-        # ---------------------------------------------------------------------
-        mask = torch.ones((1, 1, total_latents, H, W), device=device, dtype=dtype)
-
-        # Lock the first temporal slot (anchor).
-        mask[:, :, :1] = 0.0
-
-        # Lock the last temporal slots corresponding to end_samples.
-        if end_t_fix > 0:
-            mask[:, :, -end_t_fix:] = 0.0
-
-        # ---------------------------------------------------------------------
-        # 6) Inject concat_latent_image and concat_mask into conditioning.
+        # 5) Inject concat_latent_image and concat_mask into conditioning.
         #    Both positive and negative conditioning receive the same concat
         #    latent and mask so the sampler can enforce structure consistently.
+        #    conditioning_set_values only copies the per-entry dicts, not the
+        #    tensors, so one update dict can be shared by both.
         # ---------------------------------------------------------------------
-        positive = node_helpers.conditioning_set_values(
-            positive,
-            {
-                "concat_latent_image": image_cond_latent,
-                "concat_mask": mask,
-            },
-        )
-        negative = node_helpers.conditioning_set_values(
-            negative,
-            {
-                "concat_latent_image": image_cond_latent,
-                "concat_mask": mask,
-            },
-        )
+        cond_updates = {
+            "concat_latent_image": image_cond_latent,
+            "concat_mask": mask.to(dtype).expand(1, 1, total_latents, H, W),
+        }
+        positive = node_helpers.conditioning_set_values(positive, cond_updates)
+        negative = node_helpers.conditioning_set_values(negative, cond_updates)
 
         out_latent = {"samples": empty_latent}
         return io.NodeOutput(positive, negative, out_latent)
@@ -312,8 +424,10 @@ class WanCutLastSlot(io.ComfyNode):
         # ensure at least 1 slot remains.
         n = max(1, min(slots_to_cut, T - 1))
 
-        # Keep everything except the last `n` slots.
-        x_trim = x[:, :, : T - n].clone()
+        # Keep everything except the last `n` slots as a view of `x`.
+        # Nothing downstream mutates latent samples in place, and consumers
+        # that need contiguous storage (e.g. SaveLatent) make it themselves.
+        x_trim = x[:, :, : T - n]
 
         out = latents.copy()
         out["samples"] = x_trim